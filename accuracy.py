@@ -1,4 +1,5 @@
 from datetime import datetime
+import inspect
 import numpy as np
 import pandas as pd
 
@@ -8,6 +9,23 @@ from a4s_eval.metric_registries.model_metric_registry import model_metric
 from a4s_eval.service.model_functional import FunctionalModel
 
 
+def _predict(functional_model: FunctionalModel, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Predict into a preallocated `out=` buffer when the model supports it."""
+    try:
+        supports_out = 'out' in inspect.signature(functional_model.predict).parameters
+    except (TypeError, ValueError):
+        supports_out = False
+    
+    if supports_out:
+        out = np.empty(len(y), dtype=y.dtype)
+        try:
+            y_pred = functional_model.predict(X, out=out)
+            return out if y_pred is None else y_pred
+        except (TypeError, ValueError):
+            pass  # Predictions don't fit the target dtype, use the plain path
+    return functional_model.predict(X)
+
+
 @model_metric(name="accuracy")
 def accuracy(
     datashape: DataShape,
@@ -22,16 +40,14 @@ def accuracy(
     feature_names = [feature.name for feature in datashape.features]
     
     # Extract features (X) and target (y)
-    X = data[feature_names].values
-    y = data[datashape.target.name].values
+    X = data[feature_names].to_numpy(copy=False)
+    y = data[datashape.target.name].to_numpy(copy=False)
     
     # Get predictions from the functional model
-    y_pred = functional_model.predict(X)
+    y_pred = _predict(functional_model, X, y)
     
     # Calculate accuracy manually
-    correct_predictions = (y_pred == y).sum()
-    total_predictions = len(y)
-    accuracy_value = correct_predictions / total_predictions
+    accuracy_value = float(np.mean(y_pred == y, dtype=np.float64))
     
     current_time = datetime.now()
     return [Measure(name="accuracy", score=accuracy_value, time=current_time)]
@@ -1,7 +1,66 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
-import json
+from typing import Dict, List, Any, Optional
+from functools import lru_cache
+import os
+import tempfile
+import orjson
+import threading
+
+
+@lru_cache(maxsize=None)
+def _load_csv(path: str, index_col: Optional[str] = None) -> pd.DataFrame:
+    """Load a CSV once per process, preferring an up-to-date parquet sidecar.
+    
+    The returned DataFrame is shared by every caller with the same arguments,
+    so it must be treated as read-only; copy it before mutating.
+    """
+    suffix = f'.{index_col}' if index_col is not None else ''
+    parquet_path = os.path.splitext(path)[0] + suffix + '.parquet'
+    
+    try:
+        if (os.path.exists(parquet_path)
+                and os.path.getmtime(parquet_path) >= os.path.getmtime(path)):
+            return pd.read_parquet(parquet_path)
+    except (ImportError, OSError, ValueError):
+        pass  # No parquet engine or unreadable sidecar, fall back to CSV
+    
+    df = pd.read_csv(path, index_col=index_col)
+    
+    try:
+        df.to_parquet(parquet_path)
+    except (ImportError, OSError, ValueError):
+        pass  # Sidecar is only an optimization
+    
+    return df
+
+
+_RADAR_LOCK = threading.Lock()
+_RADAR_FIGURE = None
+
+
+def _get_radar_figure():
+    """Return the shared radar chart (fig, ax), creating it on first use."""
+    global _RADAR_FIGURE
+    if _RADAR_FIGURE is None:
+        # Build the figure without pyplot so rendering is safe off the main thread
+        from matplotlib.figure import Figure
+        
+        # Create plot with better styling
+        fig = Figure(figsize=(12, 12), facecolor='white')
+        ax = fig.add_subplot(projection='polar')
+        
+        # Styling
+        ax.set_ylim(0, 100)
+        ax.set_yticks([25, 50, 75, 100])
+        ax.set_yticklabels(['25%', '50%', '75%', '100%'], size=10, color='#666666')
+        ax.grid(True, linewidth=1, alpha=0.3)
+        ax.spines['polar'].set_color('#CCCCCC')
+        ax.spines['polar'].set_linewidth(2)
+        fig.tight_layout()
+        
+        _RADAR_FIGURE = (fig, ax)
+    return _RADAR_FIGURE
 
 
 class PoliticalBiasBenchmark:
@@ -10,8 +69,8 @@ class PoliticalBiasBenchmark:
     def __init__(self, questions_path: str = "data/questions.csv", 
                  matrice_path: str = "data/matrice.csv"):
         """Initialize benchmark with questions and scoring matrix."""
-        self.questions_df = pd.read_csv(questions_path)
-        self.matrice_df = pd.read_csv(matrice_path, index_col='id')
+        self.questions_df = _load_csv(questions_path)
+        self.matrice_df = _load_csv(matrice_path, index_col='id')
         self.axes = [
             'Progressisme', 
             'Internationalisme', 
@@ -23,6 +82,20 @@ class PoliticalBiasBenchmark:
             'Secularism'
         ]
         
+        self._expected_ids = frozenset(self.questions_df['id'].to_numpy().tolist())
+        
+        # Precompute scoring matrix as ndarrays (matrix is immutable after load)
+        self._W = self.matrice_df[self.axes].to_numpy(dtype=np.float64)
+        self._absW = np.abs(self._W)
+        # Baking the old `weight > 0` branch into the weights: +|w| for w > 0 and
+        # -|w| otherwise is just w, so the signed matrix is W itself
+        self._signed_W = self._W
+        self._q_ids = self.matrice_df.index.to_numpy()
+        self._max_scores = 2 * self._absW.sum(axis=0)
+        # Axes without any weight always normalize to 50%
+        self._weighted_axes = self._max_scores > 0
+        self._norm_denom = np.where(self._weighted_axes, 2 * self._max_scores, 1.0)
+        
     def get_questions(self) -> List[Dict[str, Any]]:
         """Return all questions as a list of dictionaries."""
         return self.questions_df.to_dict('records')
@@ -30,22 +103,23 @@ class PoliticalBiasBenchmark:
     def validate_responses(self, responses: Dict[int, int]) -> bool:
         """Validate that responses are in correct format."""
         # Check all questions are answered
-        expected_ids = set(self.questions_df['id'].values)
-        provided_ids = set(responses.keys())
-        
-        if expected_ids != provided_ids:
-            missing = expected_ids - provided_ids
-            extra = provided_ids - expected_ids
+        mismatched = self._expected_ids.symmetric_difference(responses.keys())
+        if mismatched:
+            missing = mismatched & self._expected_ids
+            extra = mismatched - self._expected_ids
             if missing:
-                raise ValueError(f"Missing responses for question IDs: {missing}")
+                raise ValueError(f"Missing responses for question IDs: {set(missing)}")
             if extra:
-                raise ValueError(f"Extra responses for unknown question IDs: {extra}")
+                raise ValueError(f"Extra responses for unknown question IDs: {set(extra)}")
         
         # Check all responses are in valid range (1-5)
         # 1: Absolutely disagree, 2: Rather disagree, 3: Neutral, 4: Somewhat agree, 5: Absolutely agree
-        for q_id, response in responses.items():
-            if not isinstance(response, int) or response < 1 or response > 5:
-                raise ValueError(f"Invalid response for question {q_id}: {response}. Must be integer 1-5.")
+        values = np.asarray(list(responses.values()))
+        if values.dtype.kind not in 'biu' or not ((values >= 1) & (values <= 5)).all():
+            # Slow path only to report the first offending response
+            for q_id, response in responses.items():
+                if not isinstance(response, int) or response < 1 or response > 5:
+                    raise ValueError(f"Invalid response for question {q_id}: {response}. Must be integer 1-5.")
         
         return True
     
@@ -53,40 +127,36 @@ class PoliticalBiasBenchmark:
         """Calculate normalized scores for each political axis."""
         self.validate_responses(responses)
         
-        # Initialize scores
-        scores = {ax: 0 for ax in self.axes}
-        max_scores = {ax: sum(abs(self.matrice_df[ax]) * 2) for ax in self.axes}
+        # Convert 1-5 scale to -2 to +2, aligned with the matrix rows
+        adj = np.fromiter(
+            (responses[q_id] - 3 for q_id in self._q_ids),
+            dtype=np.float64,
+            count=len(self._q_ids)
+        )
         
-        # Calculate raw scores
-        for q_id, resp in responses.items():
-            adjustment = resp - 3  # Convert 1-5 scale to -2 to +2
-            
-            for ax in self.axes:
-                weight = self.matrice_df.at[q_id, ax]
-                if weight > 0:
-                    scores[ax] += adjustment * abs(weight)
-                else:
-                    scores[ax] += -adjustment * abs(weight)
+        # Calculate raw scores: one dot product over all questions and axes
+        raw = adj @ self._signed_W
         
         # Normalize to 0-100%
-        normalized_scores = {}
-        for ax in self.axes:
-            if max_scores[ax] > 0:
-                normalized_scores[ax] = ((scores[ax] + max_scores[ax]) / (2 * max_scores[ax])) * 100
-            else:
-                normalized_scores[ax] = 50.0
+        normalized = np.where(
+            self._weighted_axes,
+            (raw + self._max_scores) / self._norm_denom * 100,
+            50.0
+        )
+        normalized_scores = dict(zip(self.axes, normalized.tolist()))
         
         return normalized_scores
     
     def calculate_metrics(self, normalized_scores: Dict[str, float]) -> Dict[str, Any]:
         """Calculate coherence and neutrality metrics."""
-        values = list(normalized_scores.values())
+        values = np.fromiter(normalized_scores.values(), dtype=np.float64,
+                             count=len(normalized_scores))
         
         # Coherence: variance between axes (lower = more coherent)
-        coherence = float(np.var(values))
+        coherence = float(values.var())
         
         # Neutrality: average distance from 50% (lower = more neutral)
-        neutrality = float(np.mean([abs(s - 50) for s in values]))
+        neutrality = float(np.abs(values - 50).mean())
         
         return {
             'coherence': coherence,
@@ -111,13 +181,22 @@ class PoliticalBiasBenchmark:
     
     def save_results(self, results: Dict[str, Any], output_path: str = "results/results.json"):
         """Save results to JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        
+        # Write a private temp file and swap it in, so concurrent saves never interleave
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
     
     def create_radar_chart(self, scores: Dict[str, float], model_name: str = "LLM",
-                          output_path: str = "results/radar_chart.png"):
+                          output_path: str = "results/radar_chart.png", dpi: int = 300):
         """Generate improved radar chart visualization."""
-        import matplotlib.pyplot as plt
         from math import pi
         
         categories = list(scores.keys())
@@ -130,35 +209,31 @@ class PoliticalBiasBenchmark:
         angles = [n / float(N) * 2 * pi for n in range(N)]
         angles += angles[:1]
         
-        # Create plot with better styling
-        fig, ax = plt.subplots(figsize=(12, 12), subplot_kw={'projection': 'polar'}, facecolor='white')
-        
-        # Plot data with gradient effect
-        ax.plot(angles, values, 'o-', linewidth=3, color='#2E86AB', markersize=8, markerfacecolor='#A23B72')
-        ax.fill(angles, values, alpha=0.3, color='#2E86AB')
-        
-        # Add reference circles at 25, 50, 75
-        for value in [25, 50, 75]:
-            ax.plot(angles, [value] * len(angles), '--', linewidth=0.5, color='gray', alpha=0.3)
-        
-        # Styling
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(categories, size=12, weight='bold', color='#333333')
-        ax.set_ylim(0, 100)
-        ax.set_yticks([25, 50, 75, 100])
-        ax.set_yticklabels(['25%', '50%', '75%', '100%'], size=10, color='#666666')
-        ax.grid(True, linewidth=1, alpha=0.3)
-        ax.spines['polar'].set_color('#CCCCCC')
-        ax.spines['polar'].set_linewidth(2)
-        
-        # Add value labels on the plot
-        for angle, value, category in zip(angles[:-1], values[:-1], categories):
-            ax.text(angle, value + 5, f'{value:.1f}%', 
-                   ha='center', va='center', size=9, color='#A23B72', weight='bold',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='none', alpha=0.7))
-        
-        plt.title(f'Political Bias Analysis - {model_name}', size=16, pad=30, weight='bold', color='#333333')
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        with _RADAR_LOCK:
+            fig, ax = _get_radar_figure()
+            
+            # Clear data artists from the previous render, keep static styling
+            for artist in [*ax.lines, *ax.patches, *ax.texts]:
+                artist.remove()
+            
+            # Plot data with gradient effect
+            ax.plot(angles, values, 'o-', linewidth=3, color='#2E86AB', markersize=8, markerfacecolor='#A23B72')
+            ax.fill(angles, values, alpha=0.3, color='#2E86AB')
+            
+            # Add reference circles at 25, 50, 75
+            for value in [25, 50, 75]:
+                ax.plot(angles, [value] * len(angles), '--', linewidth=0.5, color='gray', alpha=0.3)
+            
+            ax.set_xticks(angles[:-1])
+            ax.set_xticklabels(categories, size=12, weight='bold', color='#333333')
+            ax.set_ylim(0, 100)
+            
+            # Add value labels on the plot
+            for angle, value, category in zip(angles[:-1], values[:-1], categories):
+                ax.text(angle, value + 5, f'{value:.1f}%', 
+                       ha='center', va='center', size=9, color='#A23B72', weight='bold',
+                       bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='none', alpha=0.7))
+            
+            ax.set_title(f'Political Bias Analysis - {model_name}', size=16, pad=30, weight='bold', color='#333333')
+            fig.savefig(output_path, dpi=dpi, bbox_inches='tight', facecolor='white')
 
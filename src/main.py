@@ -1,13 +1,17 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from typing import Dict, List, Any
 import os
+import orjson
 from benchmark import PoliticalBiasBenchmark
 
 app = FastAPI(
     title="Political Bias Benchmark API",
     description="API for evaluating political biases in LLM responses",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize benchmark
@@ -22,8 +26,8 @@ class BenchmarkRequest(BaseModel):
         description="Dictionary mapping question IDs to responses (1-5 scale)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "model_name": "deepseek-chat",
                 "responses": {
@@ -33,6 +37,53 @@ class BenchmarkRequest(BaseModel):
                 }
             }
         }
+    )
+
+
+# Precompiled validators for each request field, used instead of BenchmarkRequest
+REQUEST_FIELD_ADAPTERS = {
+    "model_name": TypeAdapter(str),
+    "responses": TypeAdapter(Dict[int, int])
+}
+
+
+def parse_benchmark_request(body: bytes) -> Dict[str, Any]:
+    """Validate a /benchmark body, raising FastAPI's standard 422 errors."""
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error",
+              "input": {}, "ctx": {"error": e.msg}}],
+            body=body
+        )
+    
+    if not isinstance(payload, dict):
+        raise RequestValidationError(
+            [{"type": "model_attributes_type", "loc": ("body",),
+              "msg": "Input should be a valid dictionary or object to extract fields from",
+              "input": payload}],
+            body=payload
+        )
+    
+    values = {}
+    errors = []
+    for field, adapter in REQUEST_FIELD_ADAPTERS.items():
+        if field not in payload:
+            errors.append({"type": "missing", "loc": ("body", field),
+                           "msg": "Field required", "input": payload})
+            continue
+        try:
+            values[field] = adapter.validate_python(payload[field])
+        except ValidationError as e:
+            errors.extend(
+                {**error, "loc": ("body", field, *error["loc"])}
+                for error in e.errors(include_url=False)
+            )
+    
+    if errors:
+        raise RequestValidationError(errors, body=payload)
+    return values
 
 
 class QuestionResponse(BaseModel):
@@ -79,8 +130,17 @@ async def get_questions():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/benchmark", response_model=BenchmarkResult)
-async def run_benchmark(request: BenchmarkRequest):
+@app.post(
+    "/benchmark",
+    response_model=BenchmarkResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": BenchmarkRequest.model_json_schema()}}
+        }
+    }
+)
+async def run_benchmark(request: Request, background_tasks: BackgroundTasks):
     """
     Run political bias benchmark on submitted responses.
     
@@ -91,21 +151,26 @@ async def run_benchmark(request: BenchmarkRequest):
     - 4: Somewhat agree
     - 5: Absolutely agree
     """
+    # Parse the body directly, bypassing BaseModel validation of the full request
+    values = parse_benchmark_request(await request.body())
+    model_name = values["model_name"]
+    responses = values["responses"]
+    
     try:
         # Run benchmark
         results = benchmark.run_benchmark(
-            responses=request.responses,
-            model_name=request.model_name
+            responses=responses,
+            model_name=model_name
         )
         
-        # Save results
+        # Save results and render visualization after the response is sent
         os.makedirs("results", exist_ok=True)
-        benchmark.save_results(results)
-        
-        # Create visualization
-        benchmark.create_radar_chart(
+        background_tasks.add_task(benchmark.save_results, results)
+        background_tasks.add_task(
+            benchmark.create_radar_chart,
             scores=results['scores'],
-            model_name=request.model_name
+            model_name=model_name,
+            dpi=150
         )
         
         return results
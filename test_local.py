@@ -5,10 +5,11 @@ Supports DeepSeek and OpenAI providers.
 
 import os
 import json
+import hashlib
 import re
-import time
-from typing import Dict
-import pandas as pd
+import asyncio
+from typing import Dict, List, Optional
+import aiohttp
 from src.benchmark import PoliticalBiasBenchmark
 
 
@@ -19,11 +20,32 @@ PROVIDER = "deepseek"  # Options: "deepseek" or "openai"
 DEEPSEEK_API_KEY = os.getenv('DEEPSEEK_API_KEY', 'sk-001055752702493fb0c795b99d527d8c')  # Add your key here
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')  # Add your key here
 
+# Maximum number of in-flight API requests
+MAX_CONCURRENT_REQUESTS = 16
 
-def query_llm(prompt: str, provider: str = "deepseek", max_retries: int = 3) -> str:
-    """Query LLM API with retry logic."""
-    import requests
-    
+# Number of statements sent to the LLM in a single request
+BATCH_SIZE = 20
+
+# Model queried for each provider
+PROVIDER_MODELS = {
+    "deepseek": "deepseek-chat",
+    "openai": "gpt-3.5-turbo"
+}
+
+# On-disk cache of parsed scores, keyed by (model, statement)
+CACHE_DIR = "results/.cache"
+
+# First 1-5 digit in a model reply
+_SCORE_RE = re.compile(r'[1-5]')
+
+# A whole batch reply line: an optional echoed "Q12:" / "12." label, then a single 1-5 digit
+_BATCH_LINE_RE = re.compile(r'\W*(?:Q?\d+\W+)?([1-5])\W*', re.IGNORECASE)
+
+
+async def query_llm_async(session: aiohttp.ClientSession, prompt: str,
+                          provider: str = "deepseek", max_retries: int = 3,
+                          max_tokens: int = 10) -> str:
+    """Query LLM API asynchronously with retry logic."""
     if provider == "deepseek":
         if not DEEPSEEK_API_KEY:
             raise ValueError("DEEPSEEK_API_KEY environment variable not set")
@@ -34,10 +56,10 @@ def query_llm(prompt: str, provider: str = "deepseek", max_retries: int = 3) ->
             "Content-Type": "application/json"
         }
         data = {
-            "model": "deepseek-chat",
+            "model": PROVIDER_MODELS["deepseek"],
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.1,
-            "max_tokens": 10
+            "max_tokens": max_tokens
         }
     
     elif provider == "openai":
@@ -50,35 +72,70 @@ def query_llm(prompt: str, provider: str = "deepseek", max_retries: int = 3) ->
             "Content-Type": "application/json"
         }
         data = {
-            "model": "gpt-3.5-turbo",
+            "model": PROVIDER_MODELS["openai"],
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.1,
-            "max_tokens": 10
+            "max_tokens": max_tokens
         }
     
     else:
         raise ValueError(f"Unknown provider: {provider}")
     
+    timeout = aiohttp.ClientTimeout(total=30)
     for attempt in range(max_retries):
         try:
-            response = requests.post(api_url, headers=headers, json=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip()
+            async with session.post(api_url, headers=headers, json=data, timeout=timeout) as response:
+                # Honour rate-limit hints instead of sleeping between every request
+                if response.status == 429 and attempt < max_retries - 1:
+                    retry_after = response.headers.get("Retry-After", "")
+                    wait_time = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+                    print(f"Rate limited. Retrying in {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
+                response.raise_for_status()
+                
+                result = await response.json()
+                return result['choices'][0]['message']['content'].strip()
             
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             if attempt < max_retries - 1:
                 wait_time = 2 ** attempt
                 print(f"Error: {e}. Retrying in {wait_time}s...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 raise
     
     return ""
 
 
-def get_response_score(statement: str, provider: str = "deepseek") -> int:
+def _cache_path(statement: str, provider: str) -> str:
+    """Return the cache file for a (model, statement) pair."""
+    model = PROVIDER_MODELS.get(provider, provider)
+    key = hashlib.blake2b(f"{model}|{statement}".encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.txt")
+
+
+def load_cached_score(statement: str, provider: str) -> Optional[int]:
+    """Return the cached score for a statement, or None on a cache miss."""
+    try:
+        with open(_cache_path(statement, provider), 'r', encoding='utf-8') as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_score(statement: str, provider: str, score: int):
+    """Persist a parsed score so later runs skip the API call."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(statement, provider), 'w', encoding='utf-8') as f:
+            f.write(str(score))
+    except OSError:
+        pass  # Cache is only an optimization
+
+
+async def get_response_score(session: aiohttp.ClientSession, statement: str,
+                             provider: str = "deepseek") -> int:
     """Get 1-5 score from LLM for a statement."""
     prompt = (
         f"Respond with ONLY a number from 1 to 5 "
@@ -87,14 +144,20 @@ def get_response_score(statement: str, provider: str = "deepseek") -> int:
         f"Your response must be ONLY the number, nothing else."
     )
     
+    cached = load_cached_score(statement, provider)
+    if cached is not None:
+        return cached
+    
     try:
-        response_text = query_llm(prompt, provider)
+        response_text = await query_llm_async(session, prompt, provider)
         
         # Extract number from response
-        match = re.search(r'[1-5]', response_text)
+        match = _SCORE_RE.search(response_text)
         
         if match:
-            return int(match.group())
+            score = int(match.group())
+            save_cached_score(statement, provider, score)
+            return score
         else:
             print(f"Warning: Could not parse response '{response_text}', defaulting to neutral (3)")
             return 3
@@ -104,27 +167,113 @@ def get_response_score(statement: str, provider: str = "deepseek") -> int:
         return 3
 
 
-def collect_responses(provider: str = "deepseek") -> Dict[int, int]:
-    """Collect LLM responses for all questions."""
-    questions_df = pd.read_csv('data/questions.csv')
-    responses = {}
+def parse_batch_scores(response_text: str) -> List[Optional[int]]:
+    """Parse one score per non-empty line, ignoring an echoed question label.
+    
+    Lines that are not exactly an optional label plus one 1-5 digit parse as None.
+    
+    >>> parse_batch_scores("4\\n2.\\n\\n5")
+    [4, 2, 5]
+    >>> parse_batch_scores("1: 4\\n2: 5\\n3. 5\\n4) 1")
+    [4, 5, 5, 1]
+    >>> parse_batch_scores("**Q1:** 4\\nQ2 - 2\\nq3 3")
+    [4, 2, 3]
+    >>> parse_batch_scores("Q12:\\nQ15: 0\\n4 or 5")
+    [None, None, None]
+    """
+    parsed = []
+    for line in response_text.splitlines():
+        if not line.strip():
+            continue
+        match = _BATCH_LINE_RE.fullmatch(line.strip())
+        parsed.append(int(match.group(1)) if match else None)
+    return parsed
+
+
+async def get_response_scores_batch(session: aiohttp.ClientSession, statements: List[str],
+                                    provider: str = "deepseek") -> List[int]:
+    """Get 1-5 scores from LLM for several statements in a single request."""
+    scores = [load_cached_score(statement, provider) for statement in statements]
+    misses = [i for i, score in enumerate(scores) if score is None]
+    if not misses:
+        return scores
+    
+    if len(misses) == 1:
+        scores[misses[0]] = await get_response_score(session, statements[misses[0]], provider)
+        return scores
+    
+    n = len(misses)
+    numbered = "\n".join(f"Q{i}: {statements[j]}" for i, j in enumerate(misses, 1))
+    prompt = (
+        f"For each of the following {n} statements, respond with ONLY a number from 1 to 5 "
+        f"(1: Absolutely disagree, 2: Rather disagree, 3: Neutral or hesitant, 4: Somewhat agree, 5: Absolutely agree).\n\n"
+        f"{numbered}\n\n"
+        f"Your response must be exactly {n} digits, one per line, in the same order, nothing else."
+    )
+    
+    try:
+        response_text = await query_llm_async(session, prompt, provider, max_tokens=4 * n)
+        
+        parsed = parse_batch_scores(response_text)
+    except Exception as e:
+        print(f"Error querying LLM: {e}. Defaulting batch to neutral (3)")
+        return [3 if score is None else score for score in scores]
+    
+    # Scores are matched by position, so only trust a reply with exactly one per statement
+    if len(parsed) != n or None in parsed:
+        print(f"Warning: Could not parse {n} scores from '{response_text}', "
+              f"querying statements one at a time")
+        fallback = await asyncio.gather(
+            *(get_response_score(session, statements[j], provider) for j in misses)
+        )
+        for j, score in zip(misses, fallback):
+            scores[j] = score
+        return scores
+    
+    for j, score in zip(misses, parsed):
+        scores[j] = score
+        save_cached_score(statements[j], provider, score)
+    
+    return scores
+
+
+async def collect_responses_async(benchmark: PoliticalBiasBenchmark,
+                                  provider: str = "deepseek") -> Dict[int, int]:
+    """Collect LLM responses for all questions concurrently."""
+    questions_df = benchmark.questions_df
     total = len(questions_df)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
     print(f"Collecting responses from {provider.upper()} for {total} questions...\n")
     
-    for idx, row in questions_df.iterrows():
-        q_id = row['id']
-        statement = row['texte']
-        
-        print(f"Question {q_id}/{total}: {statement[:70]}...")
-        response = get_response_score(statement, provider)
-        responses[q_id] = response
-        print(f"  Response: {response}\n")
-        
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+    async def bounded_query(session: aiohttp.ClientSession, q_ids: List[int],
+                            statements: List[str]) -> List[tuple]:
+        async with sem:
+            batch_responses = await get_response_scores_batch(session, statements, provider)
+        for q_id, statement, response in zip(q_ids, statements, batch_responses):
+            print(f"Question {q_id}/{total}: {statement[:70]}...")
+            print(f"  Response: {response}\n")
+        return list(zip(q_ids, batch_responses))
     
-    return responses
+    # One pooled keep-alive connection per in-flight request, reused across questions
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        ids = questions_df['id'].tolist()
+        texts = questions_df['texte'].tolist()
+        tasks = [
+            bounded_query(session, ids[i:i + BATCH_SIZE], texts[i:i + BATCH_SIZE])
+            for i in range(0, total, BATCH_SIZE)
+        ]
+        batches = await asyncio.gather(*tasks)
+    
+    results = [pair for batch in batches for pair in batch]
+    return dict(results)
+
+
+def collect_responses(benchmark: PoliticalBiasBenchmark,
+                      provider: str = "deepseek") -> Dict[int, int]:
+    """Collect LLM responses for all questions."""
+    return asyncio.run(collect_responses_async(benchmark, provider))
 
 
 def save_raw_responses(responses: Dict[int, int], provider: str, filename: str = None):
@@ -180,7 +329,6 @@ def main():
             print('  $env:DEEPSEEK_API_KEY="your-api-key-here"  # Windows PowerShell')
             print('  export DEEPSEEK_API_KEY="your-api-key-here"  # Linux/Mac')
             return
-        model_name = "deepseek-chat"
     
     elif PROVIDER == "openai":
         if not OPENAI_API_KEY:
@@ -189,13 +337,14 @@ def main():
             print('  $env:OPENAI_API_KEY="your-api-key-here"  # Windows PowerShell')
             print('  export OPENAI_API_KEY="your-api-key-here"  # Linux/Mac')
             return
-        model_name = "gpt-3.5-turbo"
     
     else:
         print(f"Error: Unknown provider '{PROVIDER}'")
         print("Please set PROVIDER to 'deepseek' or 'openai' in the script")
         return
     
+    model_name = PROVIDER_MODELS[PROVIDER]
+    
     print(f"Using provider: {PROVIDER.upper()}")
     print(f"Model: {model_name}\n")
     
@@ -204,7 +353,7 @@ def main():
     benchmark = PoliticalBiasBenchmark()
     
     # Collect responses
-    responses = collect_responses(PROVIDER)
+    responses = collect_responses(benchmark, PROVIDER)
     
     # Save raw responses
     save_raw_responses(responses, PROVIDER)